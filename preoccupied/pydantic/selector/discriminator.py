@@ -42,8 +42,8 @@ class Rectangle(Shape):
 """
 
 
-from dataclasses import dataclass
-from typing import Any, Mapping, Optional
+from dataclasses import dataclass, fields
+from typing import Any, ClassVar, Mapping, Optional, Tuple
 
 from pydantic import Field
 from pydantic.fields import FieldInfo
@@ -54,15 +54,41 @@ __all__ = (
     "DiscriminatorConfig",
     "Match",
     "MatchConfig",
+    "SelectorMarker",
 )
 
 
+class SelectorMarker:
+    """
+    Common base for the field metadata markers. The kind tag lets a scan of
+    field metadata sort markers with a single isinstance test per item.
+
+    Markers are slotted frozen dataclasses, which can't restore their state
+    by attribute assignment, so they pickle and copy by reconstruction.
+    """
+
+    __slots__ = ()
+
+    DISCRIMINATOR: ClassVar[int] = 0
+    MATCH: ClassVar[int] = 1
+
+    kind: ClassVar[int]
+
+
+    def __reduce__(self) -> Tuple[Any, Tuple[Any, ...]]:
+        return (type(self), tuple(getattr(self, f.name) for f in fields(self)))
+
+
 @dataclass(frozen=True)
-class DiscriminatorConfig:
+class DiscriminatorConfig(SelectorMarker):
     """
     Marker metadata identifying discriminator behaviour for a façade field.
     """
 
+    __slots__ = ("default_value", "metadata")
+
+    kind: ClassVar[int] = SelectorMarker.DISCRIMINATOR
+
     default_value: Any
     metadata: Mapping[str, Any]
 
@@ -80,8 +106,8 @@ def Discriminator(  # noqa: N802 - factory function intentionally PascalCase
 
     info = Field(default, **field_kwargs)
 
-    if metadata is None:
-        metadata = {}
+    # copy rather than write into the caller's mapping
+    metadata = dict(metadata) if metadata else {}
 
     if missing_value is not ...:
         metadata["missing_value"] = missing_value
@@ -98,11 +124,15 @@ def Discriminator(  # noqa: N802 - factory function intentionally PascalCase
 
 
 @dataclass(frozen=True)
-class MatchConfig:
+class MatchConfig(SelectorMarker):
     """
     Marker metadata identifying a concrete subclass selector value.
     """
 
+    __slots__ = ("value",)
+
+    kind: ClassVar[int] = SelectorMarker.MATCH
+
     value: Any
 
 
@@ -112,11 +142,7 @@ def Match(value: Any) -> FieldInfo:  # noqa: N802 - PascalCase factory
     """
 
     info = Field(default=value, init=False)
-    metadata = list(info.metadata)
-    metadata.append(MatchConfig(value=value))
-
-    # annoying.
-    object.__setattr__(info, "metadata", metadata)
+    info.metadata.append(MatchConfig(value=value))
 
     return info
 
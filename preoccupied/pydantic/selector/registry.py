@@ -21,12 +21,14 @@ Selector registry abstractions for facade-based selector models.
 """
 
 
-from dataclasses import dataclass
-from typing import Any, Dict, List, Tuple, Type
+from sys import intern
+from typing import Any, Dict, Optional, Tuple, Type
+from weakref import WeakKeyDictionary
 
 from pydantic import BaseModel
+from pydantic_core import PydanticCustomError
 
-from .discriminator import DiscriminatorConfig, MatchConfig
+from .discriminator import DiscriminatorConfig, MatchConfig, SelectorMarker
 
 
 __all__ = (
@@ -35,14 +37,39 @@ __all__ = (
 )
 
 
-@dataclass(frozen=True)
-class SelectorMatch:
+DiscoveredMarkers = Tuple[
+    Tuple[Tuple[str, DiscriminatorConfig], ...],
+    Tuple[Tuple[str, MatchConfig], ...],
+]
+
+
+_discovered: "WeakKeyDictionary[Type[BaseModel], DiscoveredMarkers]" = WeakKeyDictionary()
+
+
+def _discover_markers(model_cls: Type[BaseModel]) -> DiscoveredMarkers:
     """
-    Internal helper describing a registered selector entry.
+    Scan the fields of a model class once for Discriminator and Match
+    markers. Model fields don't change after class creation, so the result
+    is remembered for as long as the class is alive.
     """
 
-    value: Any
-    subclass: Type[BaseModel]
+    found = _discovered.get(model_cls)
+    if found is not None:
+        return found
+
+    # indexed by SelectorMarker.kind
+    markers: Tuple[list, list] = ([], [])
+    for name, field_info in model_cls.model_fields.items():
+        for item in field_info.metadata:
+            if isinstance(item, SelectorMarker):
+                markers[item.kind].append((name, item))
+
+    found = (
+        tuple(markers[SelectorMarker.DISCRIMINATOR]),
+        tuple(markers[SelectorMarker.MATCH]),
+    )
+    _discovered[model_cls] = found
+    return found
 
 
 class SelectorRegistry:
@@ -65,13 +92,16 @@ class SelectorRegistry:
     def normalize(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """
         Normalize the payload to the expected format for the selector.
+
+        A payload that is already a dict is returned as-is rather than
+        copied, so implementations must copy before modifying it.
         """
 
         # TODO: the preselect_normalize method isn't documented anywhere
         # at all. whoops.
         if hasattr(self.facade, "preselect_normalize"):
             payload = self.facade.preselect_normalize(payload)
-        return dict(payload)
+        return payload if type(payload) is dict else dict(payload)
 
 
     def resolve(self, payload: Dict[str, Any]) -> Type[BaseModel]:
@@ -82,6 +112,18 @@ class SelectorRegistry:
         raise NotImplementedError
 
 
+    def construct(
+            self,
+            subclass: Type[BaseModel],
+            payload: Dict[str, Any]) -> BaseModel:
+        """
+        Build the resolved subclass from a normalized payload via
+        model_construct, without validating it.
+        """
+
+        return subclass.model_construct(**payload)
+
+
 class MatchRegistry(SelectorRegistry):
     """
     Default registry that matches payload selector values exactly.
@@ -89,14 +131,30 @@ class MatchRegistry(SelectorRegistry):
 
     def __init__(self, facade: Type[BaseModel]) -> None:
         super().__init__(facade)
-        self._entries: Dict[Any, SelectorMatch] = {}
+        self._entries: Dict[Any, Type[BaseModel]] = {}
 
         found = self.discover_discriminators()
         if len(found) != 1:
             raise ValueError(
                 f"{self.facade.__name__} must declare exactly one Discriminator field."
             )
-        self.discriminator_field, self.discriminator_config = found[0]
+        field, self.discriminator_config = found[0]
+
+        # field names declared in a class body are interned already, but
+        # one arriving from a dynamically created model may not be.
+        # Interning only guarantees that equal strings passed through
+        # intern share one object, so payload keys that are themselves
+        # interned (eg. written as literals) match by identity. Keys parsed
+        # from JSON or built at runtime generally aren't, and are compared
+        # by hash and equality as usual.
+        self.discriminator_field = intern(field)
+
+        # the config is frozen, so decide up front which value stands in for
+        # a missing selector, and which selector a mismatch falls back to.
+        # Ellipsis means there isn't one.
+        config = self.discriminator_config
+        self._missing_value = config.metadata.get("missing_value", config.default_value)
+        self._mismatch_value = config.metadata.get("mismatch_value", ...)
 
         # if the discriminator config has a default value, register it, bypassing
         # the register process because it won't have a MatchConfig
@@ -106,16 +164,11 @@ class MatchRegistry(SelectorRegistry):
 
 
     def _default_register(self, value: Any, subclass: Type[BaseModel]) -> None:
-        self._entries[value] = SelectorMatch(value=value, subclass=subclass)
+        self._entries[value] = subclass
 
 
-    def discover_discriminators(self) -> List[Tuple[str, DiscriminatorConfig]]:
-        found = []
-        for name, field_info in self.facade.model_fields.items():
-            for item in field_info.metadata:
-                if isinstance(item, DiscriminatorConfig):
-                    found.append((name, item))
-        return found
+    def discover_discriminators(self) -> Tuple[Tuple[str, DiscriminatorConfig], ...]:
+        return _discover_markers(self.facade)[0]
 
 
     def register(self, subclass: Type[BaseModel]) -> None:
@@ -126,25 +179,20 @@ class MatchRegistry(SelectorRegistry):
             )
 
         value = found[0][1].value
-        if value in self._entries:
-            existing = self._entries[value].subclass
+        existing = self._entries.get(value)
+        if existing is not None:
             raise ValueError(
                 f"Duplicate selector value '{value}' for {subclass.__name__}; "
                 f"existing mapping points to {existing.__name__}."
             )
-        self._entries[value] = SelectorMatch(value=value, subclass=subclass)
+        self._entries[value] = subclass
 
 
     def discover_matches(
             self,
-            subclass: Type[BaseModel]) -> List[Tuple[str, MatchConfig]]:
+            subclass: Type[BaseModel]) -> Tuple[Tuple[str, MatchConfig], ...]:
 
-        found = []
-        for name, field_info in subclass.model_fields.items():
-            for item in field_info.metadata:
-                if isinstance(item, MatchConfig):
-                    found.append((name, item))
-        return found
+        return _discover_markers(subclass)[1]
 
 
     def normalize(self, payload: Dict[str, Any]) -> Dict[str, Any]:
@@ -152,54 +200,80 @@ class MatchRegistry(SelectorRegistry):
         Normalize the payload to the expected format for the selector.
         """
 
+        given = payload
         payload = super().normalize(payload)
 
         field = self.discriminator_field
-        assert field is not None
-
         if field not in payload:
-            config = self.discriminator_config
-
-            missing_value = config.metadata.get("missing_value", ...)
-            if missing_value is not ...:
-                payload[field] = config.metadata["missing_value"]
-
-            elif config.default_value is not ...:
-                payload[field] = config.default_value
-
-            else:
+            missing_value = self._missing_value
+            if missing_value is ...:
                 raise ValueError(
                     f"{self.facade.__name__} requires discriminator field '{field}'."
                 )
 
+            # only the caller's own dict needs copying, anything else was
+            # already converted into a fresh dict by the base normalize
+            if payload is given:
+                payload = dict(payload)
+            payload[field] = missing_value
+
         return payload
 
 
+    def lookup(self, value: Any) -> Optional[Type[BaseModel]]:
+        """
+        Return the subclass registered for a selector value, or None.
+        """
+
+        return self._entries.get(value)
+
+
+    def coerce(self, value: Any) -> Any:
+        """
+        Return the selector value as the discriminator field should hold
+        it. Constructed models skip validation, so this stands in for it.
+        """
+
+        return value
+
+
+    def construct(
+            self,
+            subclass: Type[BaseModel],
+            payload: Dict[str, Any]) -> BaseModel:
+
+        field = self.discriminator_field
+        return subclass.model_construct(
+            **{**payload, field: self.coerce(payload[field])})
+
+
     def resolve(self, payload: Dict[str, Any]) -> Type[BaseModel]:
 
         # TODO: we could have a few different behaviors here for odd situations,
-        # like if allow_missing is True, but there's no default value... should we
-        # instantiate the facade as a fallback?
+        # like if the selector is missing, but there's neither a missing_value
+        # nor a default value... should we instantiate the facade as a fallback?
         field = self.discriminator_field
-        assert field is not None
 
         # we should have caught this in normalize, what went wrong?
         assert field in payload
         value = payload[field]
 
-        match = self._entries.get(value)
-        if match is not None:
-            return match.subclass
+        subclass = self.lookup(value)
+        if subclass is not None:
+            return subclass
 
-        config = self.discriminator_config
-        mismatch_value = config.metadata.get("mismatch_value", ...)
+        mismatch_value = self._mismatch_value
         if mismatch_value is not ...:
-            match = self._entries.get(mismatch_value)
-            if match is not None:
-                return match.subclass
-
-        raise ValueError(
-            f"No discriminator match for value '{value}' on {self.facade.__name__}."
+            subclass = self.lookup(mismatch_value)
+            if subclass is not None:
+                return subclass
+
+        # PydanticCustomError is a ValueError, and carries the value and
+        # facade as structured context for callers that want them
+        raise PydanticCustomError(
+            "no_discriminator_match",
+            "No discriminator match for value '{value}' on {facade}.",
+            {"value": str(value), "facade": self.facade.__name__},
         )
 
 
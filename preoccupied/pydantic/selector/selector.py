@@ -21,13 +21,22 @@ Dynamic discriminator helpers and registration-aware base model primitives.
 """
 
 
-from typing import Any, Dict, Optional, Tuple, Type
+from typing import Any, Dict, Optional, Tuple, Type, Union
 
 from pydantic import BaseModel
+from pydantic_core import to_json
 
+from .discriminator import Match
 from .registry import MatchRegistry, SelectorRegistry
 
 
+try:
+    from pydantic_core import from_json
+except ImportError:  # pragma: no cover
+    # pydantic-core releases older than pydantic 2.5 lack from_json
+    from json import loads as from_json
+
+
 __all__ = (
     "SelectorMeta",
     "MatchSelector",
@@ -44,30 +53,30 @@ class SelectorMeta(type(BaseModel)):
         Route façade instantiation through validation to return concrete subclasses.
         """
 
-        facade = getattr(cls, "__selector_facade__", cls)
-        if facade is cls:
-            # we're overriding initialization and relying on model_validate to
-            # be the one that will pick the appropriate subclass, so we need to
-            # do some of the translation from __init__ to model_validate that would
-            # normally be taken care of by pydantic itself.
-
-            if args and kwargs:
-                raise TypeError(
-                    "Mixing positional and keyword arguments is not"
-                    " supported for façades.")
-            if kwargs:
-                payload: Any = kwargs
-            elif len(args) == 1:
-                payload = args[0]
-            elif not args:
-                payload = {}
-            else:
-                raise TypeError(
-                    "Unexpected positional arguments for façade"
-                    " instantiation.")
+        if cls.__selector_facade__ is not cls:
+            # concrete subclasses construct normally
+            return super().__call__(*args, **kwargs)
+
+        # we're overriding initialization and relying on model_validate to
+        # be the one that will pick the appropriate subclass, so we need to
+        # do some of the translation from __init__ to model_validate that would
+        # normally be taken care of by pydantic itself.
 
-            return cls.model_validate(payload)
-        return super().__call__(*args, **kwargs)
+        if not args:
+            # kwargs is already a fresh dict owned by this call, and covers
+            # the no-argument case as an empty payload
+            return cls.model_validate(kwargs)
+
+        if kwargs:
+            raise TypeError(
+                "Mixing positional and keyword arguments is not"
+                " supported for façades.")
+        if len(args) != 1:
+            raise TypeError(
+                "Unexpected positional arguments for façade"
+                " instantiation.")
+
+        return cls.model_validate(args[0])
 
 
     def __new__(  # type: ignore[override]
@@ -75,8 +84,12 @@ class SelectorMeta(type(BaseModel)):
             name: str,
             bases: Tuple[type, ...],
             namespace: Dict[str, Any],
+            selector: Any = ...,
             **kwargs: Any) -> Type[BaseModel]:
 
+        if selector is not ...:
+            mcls._inject_selector(name, bases, namespace, selector)
+
         model_cls = super().__new__(mcls, name, bases, namespace, **kwargs)
 
         if model_cls.__dict__.get("__selector_registry_cls__", None) is not None:
@@ -94,18 +107,54 @@ class SelectorMeta(type(BaseModel)):
                 # this is a concrete subclass of an existing façade.
                 mcls._register_subclass(facade, model_cls)
 
-        # we wedge our own impl of model_validate into the class if
-        # one isn't provided.
-        if "model_validate" not in model_cls.__dict__:
-            setattr(
-                model_cls,
-                "model_validate",
-                classmethod(_model_validate_helper)
-            )
+        # we wedge our own impl of model_validate and model_validate_json
+        # into the class if one isn't provided, and it isn't already
+        # inheriting ours.
+        for attr, wedge in _WEDGES:
+            if attr not in model_cls.__dict__ and \
+               _inherited_descriptor(model_cls, attr) is not wedge:
+                setattr(model_cls, attr, wedge)
 
         return model_cls
 
 
+    @classmethod
+    def _inject_selector(
+            cls,
+            name: str,
+            bases: Tuple[type, ...],
+            namespace: Dict[str, Any],
+            selector: Any) -> None:
+        """
+        Support for the ``selector=`` class keyword, which is shorthand for
+        declaring the façade's discriminator field with ``Match(selector)``
+        in the class body.
+        """
+
+        facade = None
+        for base in bases:
+            facade = getattr(base, "__selector_facade__", None)
+            if facade is not None:
+                break
+        else:
+            raise TypeError(
+                f"{name} must subclass a façade to use the selector keyword.")
+
+        field = getattr(facade.__selector_registry__, "discriminator_field", None)
+        if field is None:
+            raise TypeError(
+                f"{facade.__name__} does not support the selector keyword.")
+
+        annotations = namespace.setdefault("__annotations__", {})
+        if field in namespace or field in annotations:
+            raise TypeError(
+                f"{name} cannot both declare '{field}' and use the"
+                " selector keyword.")
+
+        annotations[field] = facade.model_fields[field].annotation
+        namespace[field] = Match(selector)
+
+
     @classmethod
     def _initialize_base(cls, model_cls: Type[BaseModel]) -> None:
         """
@@ -116,6 +165,11 @@ class SelectorMeta(type(BaseModel)):
         if not hasattr(model_cls, "__selector_registry_cls__"):
             model_cls.__selector_registry_cls__ = MatchRegistry
 
+        # seeded here so that facades and their subclasses can read these
+        # directly, rather than through getattr with a default
+        model_cls.__selector_facade__ = None
+        model_cls.__selector_registry__ = None
+
 
     @classmethod
     def _configure_facade(cls, model_cls: Type[BaseModel]) -> None:
@@ -123,8 +177,7 @@ class SelectorMeta(type(BaseModel)):
         Initialize a façade capable of routing to registered subclasses.
         """
 
-        registry_cls: Type[SelectorRegistry] = getattr(
-            model_cls, "__selector_registry_cls__", None)
+        registry_cls: Type[SelectorRegistry] = model_cls.__selector_registry_cls__
 
         # we set that value during _initialize_base, so it had damned
         # well better be present.
@@ -143,7 +196,7 @@ class SelectorMeta(type(BaseModel)):
         Register a subclass beneath the identified root façade.
         """
 
-        registry: SelectorRegistry = getattr(facade, "__selector_registry__", None)
+        registry: SelectorRegistry = facade.__selector_registry__
         assert registry is not None
 
         registry.register(model_cls)
@@ -165,15 +218,23 @@ def _model_validate_helper(
     subclasses.
     """
 
-    if cls is getattr(cls, "__selector_root__", cls):
-        registry: SelectorRegistry = getattr(cls, "__selector_registry__", None)
-        assert registry is not None
+    if cls.__selector_facade__ is cls:
+        if isinstance(obj, cls) and \
+           type(obj).model_config.get("revalidate_instances", "never") == "never":
+            # pydantic would hand back an existing instance untouched, so
+            # don't pull it apart into a dict to dispatch it all over again.
+            # It is the instance's own class that decides that.
+            return obj
+
+        registry: SelectorRegistry = cls.__selector_registry__
 
         obj = registry.normalize(obj)
         subclass = registry.resolve(obj)
 
         if subclass is not cls:
             # we might allow registry to resolve to the facade itself.
+            if cls.__selector_trusted__:
+                return registry.construct(subclass, obj)
             return subclass.model_validate(
                 obj,
                 strict=strict,
@@ -181,14 +242,88 @@ def _model_validate_helper(
                 context=context)
         # fallthru
 
-    return BaseModel.model_validate.__func__(
-        cls,
+    # this is all BaseModel.model_validate would do for us
+    return cls.__pydantic_validator__.validate_python(
         obj,
         strict=strict,
         from_attributes=from_attributes,
         context=context)
 
 
+def _model_validate_json_helper(
+        cls: Type[BaseModel],
+        json_data: Union[str, bytes, bytearray],
+        *,
+        strict: Optional[bool] = None,
+        context: Optional[Dict[str, Any]] = None,
+        **kwargs: Any) -> Type[BaseModel]:
+    """
+    Perform dynamic validation of JSON input, dispatching façade classes
+    to registered subclasses. The parsed document is only used to select
+    the subclass, which then validates the JSON itself in JSON mode. That
+    holds even for trusted façades, since a JSON document can't already
+    hold values of non-JSON types.
+    """
+
+    if cls.__selector_facade__ is cls:
+        try:
+            payload = from_json(json_data)
+        except (TypeError, ValueError):
+            # leave it to the façade's own validator to report the bad input
+            payload = None
+
+        if isinstance(payload, dict):
+            registry: SelectorRegistry = cls.__selector_registry__
+
+            obj = registry.normalize(payload)
+            subclass = registry.resolve(obj)
+
+            if obj is not payload:
+                # normalize filled in (or rewrote) values, so the original
+                # document no longer holds what we dispatched on
+                json_data = to_json(obj, serialize_unknown=True)
+
+            if subclass is not cls:
+                return subclass.model_validate_json(
+                    json_data,
+                    strict=strict,
+                    context=context,
+                    **kwargs)
+        # fallthru
+
+    return BaseModel.model_validate_json.__func__(
+        cls,
+        json_data,
+        strict=strict,
+        context=context,
+        **kwargs)
+
+
+# a classmethod object holds no per-class state, so every selector class
+# can share these
+_MODEL_VALIDATE = classmethod(_model_validate_helper)
+_MODEL_VALIDATE_JSON = classmethod(_model_validate_json_helper)
+
+_WEDGES = (
+    ("model_validate", _MODEL_VALIDATE),
+    ("model_validate_json", _MODEL_VALIDATE_JSON),
+)
+
+
+def _inherited_descriptor(model_cls: Type[BaseModel], attr: str) -> Any:
+    """
+    The raw descriptor for attr that model_cls inherits, found without
+    triggering the descriptor. This normally stops at the façade, or at
+    whichever subclass in between overrode it.
+    """
+
+    for base in model_cls.__mro__[1:]:
+        found = base.__dict__.get(attr)
+        if found is not None:
+            return found
+    return None
+
+
 class MatchSelector(BaseModel, metaclass=SelectorMeta):
     """
     Base model class for selector façades.
@@ -196,9 +331,10 @@ class MatchSelector(BaseModel, metaclass=SelectorMeta):
     Façades must declare a single discriminator field using the `Discriminator`
     helper.
 
-    Instantiation or `model_validate(...)` will select the appropriate subclass
-    based on the value of the discriminator field on the incoming data, compared
-    against the values of the field on the registered subclasses.
+    Instantiation, `model_validate(...)`, or `model_validate_json(...)` will
+    select the appropriate subclass based on the value of the discriminator
+    field on the incoming data, compared against the values of the field on
+    the registered subclasses.
     """
 
     # strictly speaking this isn't necessary to declare here, since
@@ -206,5 +342,31 @@ class MatchSelector(BaseModel, metaclass=SelectorMeta):
     # wondering how to override their registry class. You do it like this.
     __selector_registry_cls__ = MatchRegistry
 
+    # façades fed only from trusted sources can set this to have
+    # dispatched payloads built via model_construct. That skips all field
+    # validation, coercion, and validators on the chosen subclass, so
+    # the payload must already hold correctly typed values. JSON input
+    # can't, so model_validate_json always validates.
+    __selector_trusted__: bool = False
+
+
+    @classmethod
+    def model_dispatch_construct(cls, obj: Any) -> BaseModel:
+        """
+        Select the concrete subclass for `obj` just as `model_validate`
+        would, but build it with `model_construct`. No field validation,
+        coercion, or validators run, so this is only for payloads that are
+        already known to be valid, such as ones previously dumped from a
+        validated model. Only the discriminator value is converted, by the
+        registry, to the type its field holds.
+        """
+
+        if cls.__selector_facade__ is cls:
+            registry: SelectorRegistry = cls.__selector_registry__
+            obj = registry.normalize(obj)
+            return registry.construct(registry.resolve(obj), obj)
+
+        return cls.model_construct(**obj)
+
 
 # The end.
@@ -41,9 +41,13 @@ assert result == "alpha"
 """
 
 
-import re
-from typing import (Dict, Generic, Iterator, List, Mapping, Optional,
-                    Protocol, Sequence, Tuple, TypeVar, Union)
+import operator
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from functools import lru_cache
+from typing import (Any, Callable, Dict, Generic, Iterable, Iterator, List,
+                    Mapping, Optional, Protocol, Sequence, Tuple, TypeVar,
+                    Union)
 
 from semver import Version
 
@@ -57,7 +61,109 @@ class _Sentinel:
 _MISSING = _Sentinel()
 
 
-matcher_like = re.compile(r"^[<>=]=?").match
+class LRUCache(OrderedDict):
+    """
+    Bounded mapping that forgets its least recently used entries. None is
+    never stored, and stands for a miss.
+
+    Entries may be evicted or cleared by another thread between two steps
+    of a lookup or a store. Those steps tolerate that rather than raising
+    KeyError out of an otherwise ordinary lookup.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+
+
+    def lookup(self, key: Any) -> Any:
+        """
+        Return the value cached for `key`, or None, marking a hit as the most
+        recently used.
+        """
+
+        value = self.get(key)
+        if value is not None:
+            try:
+                self.move_to_end(key)
+            except KeyError:
+                # dropped since the get, but the value we have is still good
+                pass
+        return value
+
+
+    def store(self, key: Any, value: Any) -> None:
+        """
+        Cache `value` for `key`, evicting the least recently used entry if
+        that takes the cache over its size.
+        """
+
+        self[key] = value
+        if len(self) > self.maxsize:
+            try:
+                self.popitem(last=False)
+            except KeyError:
+                # emptied since the store
+                pass
+
+
+# selectors starting with any of these are treated as range-like match
+# expressions rather than plain versions
+_RANGE_PREFIX = ("<", ">", "=")
+
+
+Matcher = Tuple[Callable[[Version, Version], bool], Version]
+
+
+_OPERATORS: Dict[str, Callable[[Version, Version], bool]] = {
+    "<=": operator.le,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    ">": operator.gt,
+}
+
+
+@lru_cache(maxsize=1024)
+def _parse_matchers(selector: str) -> Tuple[Matcher, ...]:
+    """
+    Compile a semicolon-delimited selector into a tuple of comparison
+    functions paired with the parsed Version they compare against. A
+    matcher without an operator is treated as an equality test, the same
+    as ``Version.match`` would.
+    """
+
+    found = []
+    for matcher in selector.split(";"):
+        matcher = matcher.strip()
+        prefix = matcher[:2]
+        if prefix not in _OPERATORS:
+            prefix = matcher[:1]
+            if prefix not in _OPERATORS:
+                prefix = ""
+
+        compare = _OPERATORS.get(prefix, operator.eq)
+        found.append((compare, Version.parse(matcher[len(prefix):].strip())))
+
+    return tuple(found)
+
+
+def _satisfies(version: Version, matchers: Tuple[Matcher, ...]) -> bool:
+    """
+    True if `version` passes every compiled matcher.
+    """
+
+    return all(compare(version, other) for compare, other in matchers)
+
+
+@lru_cache(maxsize=1024)
+def _parse_version(selector: str) -> Version:
+    """
+    Parse a plain (non-range) selector into a Version.
+    """
+
+    return Version.parse(selector.strip())
 
 
 class ResolutionPolicy(Protocol):
@@ -80,6 +186,60 @@ class ResolutionPolicy(Protocol):
         ...
 
 
+def _nearest_le(available: Sequence[Version], version: Version) -> Optional[Version]:
+    """
+    The greatest available version not exceeding `version`, or None.
+    """
+
+    index = bisect_right(available, version) - 1
+    return available[index] if index >= 0 else None
+
+
+def _nearest_ge(available: Sequence[Version], version: Version) -> Optional[Version]:
+    """
+    The smallest available version not less than `version`, or None.
+    """
+
+    index = bisect_left(available, version)
+    return available[index] if index < len(available) else None
+
+
+def _exactly(available: Sequence[Version], version: Version) -> Optional[Version]:
+    """
+    The available version equal to `version`, or None.
+    """
+
+    index = bisect_left(available, version)
+    if index < len(available) and available[index] == version:
+        return available[index]
+    return None
+
+
+def _resolve_selector(
+        selector: Union[str, Version],
+        available: Sequence[Version],
+        nearest: Callable[[Sequence[Version], Version], Optional[Version]],
+        ascending: bool) -> Optional[Version]:
+    """
+    Shared kernel for the built-in policies. Range-like selectors are
+    compiled and checked against each available version, in ascending or
+    descending order, until one satisfies every matcher. Plain selectors
+    are parsed and handed to `nearest` along with the sorted versions.
+    """
+
+    if isinstance(selector, str):
+        if selector.startswith(_RANGE_PREFIX):
+            matchers = _parse_matchers(selector)
+            for version in (available if ascending else reversed(available)):
+                if _satisfies(version, matchers):
+                    return version
+            return None
+
+        selector = _parse_version(selector)
+
+    return nearest(available, selector)
+
+
 class ResolveVersionLE(ResolutionPolicy):
     """
     Resolve selectors toward the greatest available version not exceeding the request.
@@ -96,35 +256,17 @@ class ResolveVersionLE(ResolutionPolicy):
         Range-like selectors (containing semicolon-delimited match expressions
         such as ``<=1.2.0;>=1.0.0``) are applied against each version in
         ascending order until all constraints succeed. Non-range selectors are
-        treated as a single ``<=`` comparison evaluated from the highest
-        available version downward.
+        treated as a single ``<=`` comparison, located by binary search of the
+        sorted available versions.
         """
 
         if not available:
             return None
 
         if selector is None:
-            return available[0] if available else None
-
-        if isinstance(selector, Version):
-            selector = str(selector)
-
-        if matcher_like(selector):
-            matchers = selector.split(";")
-            for version in available:
-                for matcher in matchers:
-                    if not version.match(matcher):
-                        break
-                else:
-                    return version
-
-        else:
-            matcher = f"<={selector.strip()}"
-            for version in reversed(available):
-                if version.match(matcher):
-                    return version
+            return available[0]
 
-        return None
+        return _resolve_selector(selector, available, _nearest_le, True)
 
 
 class ResolveVersionGE(ResolutionPolicy):
@@ -142,35 +284,17 @@ class ResolveVersionGE(ResolutionPolicy):
 
         Range-like selectors are evaluated by scanning the available versions in
         descending order until every constraint succeeds. Non-range selectors are
-        interpreted as a single ``>=`` comparison evaluated from the lowest
-        available version upward.
+        interpreted as a single ``>=`` comparison, located by binary search of
+        the sorted available versions.
         """
 
         if not available:
             return None
 
         if selector is None:
-            return available[-1] if available else None
-
-        if isinstance(selector, Version):
-            selector = str(selector)
-
-        if matcher_like(selector):
-            matchers = selector.split(";")
-            for version in reversed(available):
-                for matcher in matchers:
-                    if not version.match(matcher):
-                        break
-                else:
-                    return version
-
-        else:
-            matcher = f">={selector.strip()}"
-            for version in available:
-                if version.match(matcher):
-                    return version
+            return available[-1]
 
-        return None
+        return _resolve_selector(selector, available, _nearest_ge, False)
 
 
 class ResolveVersionExact(ResolutionPolicy):
@@ -188,45 +312,47 @@ class ResolveVersionExact(ResolutionPolicy):
 
         Range-like selectors are evaluated from highest to lowest version so the
         most recent satisfying entry wins. Non-range selectors are interpreted
-        as a single equality comparison.
+        as a single equality comparison, located by binary search of the sorted
+        available versions.
         """
 
-        if not available:
+        if not available or selector is None:
             return None
 
-        if selector is None:
-            return None
+        return _resolve_selector(selector, available, _exactly, False)
 
-        if isinstance(selector, Version):
-            selector = str(selector)
 
-        if matcher_like(selector):
-            matchers = selector.split(";")
-            for version in reversed(available):
-                for matcher in matchers:
-                    if not version.match(matcher):
-                        break
-                else:
-                    return version
+# the built-in policies are stateless, so they're shared
+_RESOLVE_LE = ResolveVersionLE()
+_RESOLVE_GE = ResolveVersionGE()
+_RESOLVE_EXACT = ResolveVersionExact()
 
-        else:
-            matcher = f"=={selector.strip()}"
-            for version in available:
-                if version.match(matcher):
-                    return version
 
-        return None
+_POLICIES: Dict[str, ResolutionPolicy] = {
+    "nearest_le": _RESOLVE_LE,
+    "le": _RESOLVE_LE,
+    "nearest_ge": _RESOLVE_GE,
+    "ge": _RESOLVE_GE,
+    "exact": _RESOLVE_EXACT,
+    "eq": _RESOLVE_EXACT,
+}
+
+# the shared built-in resolvers live as long as the module, so their ids
+# are stable. Only these are trusted to resolve a stored version to itself
+# and to be worth caching.
+_BUILTIN_RESOLVERS = frozenset(map(id, _POLICIES.values()))
 
 
-def lookup_policy(policy: str) -> Optional[ResolutionPolicy]:
-    if policy in ("nearest_le", "le"):
-        return ResolveVersionLE()
-    elif policy in ("nearest_ge", "ge"):
-        return ResolveVersionGE()
-    elif policy in ("exact", "eq"):
-        return ResolveVersionExact()
-    else:
-        return None
+def lookup_policy(
+        policy: Union[str, ResolutionPolicy, None]) -> Optional[ResolutionPolicy]:
+    """
+    Return the shared resolver for a policy name, or None if the name is not
+    known. A ResolutionPolicy instance is returned as-is.
+    """
+
+    if policy is None or isinstance(policy, str):
+        return _POLICIES.get(policy)
+    return policy
 
 
 V = TypeVar("V")
@@ -240,18 +366,21 @@ class SemverMap(Generic[V]):
     def __init__(
             self,
             *,
-            default_policy: Union[str, ResolutionPolicy, None] = None) -> None:
-
-        self._default_policy = lookup_policy(default_policy) or ResolveVersionExact()
+            default_policy: Union[str, ResolutionPolicy, None] = None,
+            cache_size: int = 512) -> None:
 
-        # map of Version to value
-        self._entries: Dict[Version, V] = {}
+        self._default_policy = lookup_policy(default_policy) or _RESOLVE_EXACT
+        self._default_builtin = id(self._default_policy) in _BUILTIN_RESOLVERS
 
-        # sorted list of Versions from _entries.keys()
+        # sorted list of stored Versions
         self._versions: List[Version] = []
 
-        # cache of selector str to Version, bypassing the resolver
-        self._cache: Dict[str, Version] = {}
+        # values, stored at the same index as their Version in _versions
+        self._values: List[V] = []
+
+        # bounded LRU cache of selector to index in _versions, bypassing the
+        # resolver. Only successful resolutions are cached.
+        self._cache: LRUCache = LRUCache(cache_size)
 
 
     def resolver(
@@ -263,11 +392,11 @@ class SemverMap(Generic[V]):
 
         if policy is None:
             return self._default_policy
-        elif isinstance(policy, str):
-            policy = lookup_policy(policy)
-            if policy is None:
-                raise ValueError(f"Invalid policy: {policy}")
-        return policy
+
+        resolver = lookup_policy(policy)
+        if resolver is None:
+            raise ValueError(f"Invalid policy: {policy}")
+        return resolver
 
 
     def set(self, version: Union[str, Version], value: V) -> None:
@@ -276,17 +405,19 @@ class SemverMap(Generic[V]):
         """
 
         if isinstance(version, str):
-            version = Version.parse(version)
+            version = _parse_version(version)
 
-        if version in self._entries:
-            self._entries[version] = value
+        versions = self._versions
+        index = bisect_left(versions, version)
+        if index < len(versions) and versions[index] == version:
+            self._values[index] = value
 
         else:
-            # adding a new version means we need to clear the cache and re-sort the
-            # versions list
+            # adding a new version means we need to clear the cache and insert
+            # the version and value at their sorted position
             self._cache.clear()
-            self._entries[version] = value
-            self._versions = sorted(self._entries.keys())
+            versions.insert(index, version)
+            self._values.insert(index, value)
 
 
     def get(self,
@@ -308,23 +439,155 @@ class SemverMap(Generic[V]):
         :return: The value for the selector.
         """
 
-        if policy is None:
-            if selector in self._cache:
-                version = self._cache[selector]
-            else:
-                resolver = self.resolver()
-                version = resolver.resolve(selector, self._versions)
-                self._cache[selector] = version
-        else:
-            # when a policy is provided, we bypass the cache
-            resolver = self.resolver(policy)
-            version = resolver.resolve(selector, self._versions)
+        index = self._cached_index(selector, self.resolver(policy))
 
-        if version is None or version not in self._entries:
+        if index < 0:
             if default is _MISSING:
                 raise ValueError(f"No version matching {selector}")
             return default
-        return self._entries[version]
+        return self._values[index]
+
+
+    def get_many(
+            self,
+            selectors: Iterable[Union[str, Version, None]],
+            default: Union[V, _Sentinel] = _MISSING,
+            *,
+            policy: Union[str, ResolutionPolicy, None] = None) -> List[V]:
+        """
+        Retrieve the values for many selectors at once, as if by calling
+        :meth:`get` on each of them. The policy is looked up only once for
+        the whole batch.
+
+        :param selectors: The selectors to retrieve values for.
+        :param policy: The policy to use to resolve the selectors.
+        :param default: The default value for any selector not found.
+        :return: The values for the selectors, in the same order.
+        """
+
+        resolver = self.resolver(policy)
+        find = self._cached_index
+
+        values = self._values
+        found = []
+        for selector in selectors:
+            index = find(selector, resolver)
+            if index >= 0:
+                found.append(values[index])
+            elif default is _MISSING:
+                raise ValueError(f"No version matching {selector}")
+            else:
+                found.append(default)
+        return found
+
+
+    def get_version(
+            self,
+            version: Version,
+            default: Union[V, _Sentinel] = _MISSING) -> V:
+        """
+        Retrieve the value for an already parsed `version` using the default
+        policy. When that is a built-in policy, a stored version is returned
+        directly without consulting it at all. Missing versions behave as in
+        :meth:`get`.
+
+        :param version: The version to retrieve the value for.
+        :param default: The default value to return if the version is not found.
+        :return: The value for the version.
+        """
+
+        index = self._index(version) if self._default_builtin else -1
+        if index < 0:
+            index = self._cached_index(version)
+            if index < 0:
+                if default is _MISSING:
+                    raise ValueError(f"No version matching {version}")
+                return default
+        return self._values[index]
+
+
+    def _cached_index(
+            self,
+            selector: Union[str, Version, None],
+            resolver: Optional[ResolutionPolicy] = None) -> int:
+        """
+        Return the index of the version `resolver` (the default policy if
+        None) resolves `selector` to, or -1. Only the built-in policies are
+        shortcut by an exact stored version or by the LRU cache. Default
+        policy entries are keyed by the selector alone, and any other
+        policy's entries by a (selector, resolver) pair. Custom policies are
+        consulted on every call, since they needn't resolve a stored version
+        to itself, nor be hashable or deterministic.
+        """
+
+        if resolver is None:
+            resolver = self._default_policy
+
+        if id(resolver) not in _BUILTIN_RESOLVERS:
+            return self._resolve_index(selector, resolver)
+
+        key: Any = selector if resolver is self._default_policy else (selector, resolver)
+
+        cache = self._cache
+        index = cache.lookup(key)
+        if index is not None:
+            return index
+
+        index = self._exact_index(selector)
+        if index < 0:
+            index = self._resolve_index(selector, resolver)
+
+        if index >= 0 and selector is not None:
+            cache.store(key, index)
+        return index
+
+
+    def _exact_index(self, selector: Union[str, Version, None]) -> int:
+        """
+        Return the index of a plain version selector that is stored exactly,
+        or -1. Every built-in policy resolves a stored version to itself, so
+        this hit can skip the policy entirely. Custom policies make no such
+        promise, and are always consulted.
+        """
+
+        if isinstance(selector, str):
+            if selector.startswith(_RANGE_PREFIX):
+                return -1
+            try:
+                selector = _parse_version(selector)
+            except ValueError:
+                # leave it to the policy to decide what this means
+                return -1
+
+        elif not isinstance(selector, Version):
+            return -1
+
+        return self._index(selector)
+
+
+    def _resolve_index(
+            self,
+            selector: Union[str, Version, None],
+            resolver: ResolutionPolicy) -> int:
+        """
+        Return the index of the version `resolver` selects, or -1.
+        """
+
+        version = resolver.resolve(selector, self._versions)
+        return -1 if version is None else self._index(version)
+
+
+    def _index(self, version: Version) -> int:
+        """
+        Return the position of `version` in the stored versions, or -1 if it
+        is not stored.
+        """
+
+        versions = self._versions
+        index = bisect_left(versions, version)
+        if index < len(versions) and versions[index] == version:
+            return index
+        return -1
 
 
     def __getitem__(self, selector: str) -> V:
@@ -357,15 +620,10 @@ class SemverMap(Generic[V]):
         """
 
         if isinstance(selector, str):
-            if self._cache.get(selector) is not None:
-                return True
-            else:
-                resolver = self.resolver()
-                version = resolver.resolve(selector, self._versions)
-                return version is not None and version in self._entries
+            return self._cached_index(selector) >= 0
 
         elif isinstance(selector, Version):
-            return selector in self._entries
+            return self._index(selector) >= 0
 
         return False
 
@@ -376,13 +634,15 @@ class SemverMap(Generic[V]):
         """
 
         if isinstance(selector, str):
-            selector = Version.parse(selector)
+            selector = _parse_version(selector)
 
-        # allow this to raise KeyError if the version is not found
-        del self._entries[selector]
+        index = self._index(selector)
+        if index < 0:
+            raise KeyError(selector)
 
+        del self._versions[index]
+        del self._values[index]
         self._cache.clear()
-        self._versions = sorted(self._entries.keys())
 
 
     def items(self) -> Iterator[Tuple[Version, V]]:
@@ -390,7 +650,7 @@ class SemverMap(Generic[V]):
         Return an iterator over the stored versions and values in ascending semantic order.
         """
 
-        return self._entries.items()
+        return zip(self._versions, self._values)
 
 
     def values(self) -> Iterator[V]:
@@ -398,7 +658,7 @@ class SemverMap(Generic[V]):
         Return an iterator over the stored values in ascending semantic order.
         """
 
-        return self._entries.values()
+        return iter(self._values)
 
 
     def versions(self) -> Iterator[Version]:
@@ -406,7 +666,7 @@ class SemverMap(Generic[V]):
         Return an iterator over the stored versions in ascending semantic order.
         """
 
-        return self._entries.keys()
+        return iter(self._versions)
 
 
     def earliest(self) -> Optional[Version]:
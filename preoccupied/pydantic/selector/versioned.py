@@ -21,7 +21,7 @@ Example:
 
 ```python
 class Thing(VersionedSelector):
-    version: Version = Discriminator(default="1.0.0", allow_missing=True)
+    version: Version = Discriminator(missing_value="1.0.0")
     payload: str
 
 class Thing_v1(Thing):
@@ -51,6 +51,7 @@ assert thing.payload == "v2"
 :ai-assistant: GPT-5 Codex via Cursor
 """
 
+from functools import lru_cache
 from typing import Any, Callable, Optional, Type
 
 from semver import Version as SemVersion
@@ -61,7 +62,7 @@ from pydantic_core import core_schema
 
 from .registry import MatchRegistry
 from .selector import MatchSelector
-from .semvermap import SemverMap
+from .semvermap import LRUCache, SemverMap
 
 
 __all__ = (
@@ -71,6 +72,16 @@ __all__ = (
 )
 
 
+@lru_cache(maxsize=1024)
+def _parse_version(value: str) -> "Version":
+    """
+    Parse a version string. Only a handful of distinct version strings show
+    up in practice, so the parsed (immutable) instances are shared.
+    """
+
+    return Version.parse(value)
+
+
 def _ensure_version(value: Any) -> SemVersion:
     """
     Convert supported inputs into a ``semver.Version`` instance.
@@ -79,7 +90,7 @@ def _ensure_version(value: Any) -> SemVersion:
     if isinstance(value, SemVersion):
         return value
     if isinstance(value, str):
-        return Version.parse(value)
+        return _parse_version(value)
     raise TypeError(f"Unsupported version value: {value!r}")
 
 
@@ -90,6 +101,19 @@ class Version(SemVersion):
     https://python-semver.readthedocs.io/en/3.0.4/advanced/combine-pydantic-and-semver.html
     """
 
+    __slots__ = ("_str", )
+
+
+    def __str__(self) -> str:
+        # versions are immutable, and parsed instances are shared, so the
+        # string form only needs to be built once
+        try:
+            return self._str
+        except AttributeError:
+            self._str = found = super().__str__()
+            return found
+
+
     @classmethod
     def __get_pydantic_core_schema__(
             cls,
@@ -129,11 +153,18 @@ class VersionedRegistry(MatchRegistry):
     Registry that resolves selectors using :class:`SemverMap`.
     """
 
+    resolved_cache_size: int = 1024
+
+
     def __init__(self, facade: Type[MatchSelector]) -> None:
         super().__init__(facade)
         policy = getattr(facade, "__version_policy__", "le")
         self._entries = SemverMap(default_policy=policy)
 
+        # bounded LRU of raw selector value to resolved subclass, cleared
+        # whenever a new subclass registers
+        self._resolved: LRUCache = LRUCache(self.resolved_cache_size)
+
 
     def register(self, subclass: Type[BaseModel]) -> None:
         found = self.discover_matches(subclass)
@@ -146,6 +177,36 @@ class VersionedRegistry(MatchRegistry):
 
         # We bypass the normal registration process to skip the dup checking.
         super()._default_register(value, subclass)
+        self._resolved.clear()
+
+
+    def lookup(self, value: Any) -> Optional[Type[BaseModel]]:
+        """
+        Return the subclass the version policy selects for a selector value,
+        or None. Values are parsed once and handed to the SemverMap as a
+        Version, rather than round-tripping through a string. Successful
+        resolutions are remembered per raw value.
+        """
+
+        resolved = self._resolved
+        if isinstance(value, (str, SemVersion)):
+            subclass = resolved.lookup(value)
+            if subclass is not None:
+                return subclass
+
+        subclass = self._entries.get_version(_ensure_version(value), None)
+        if subclass is not None:
+            resolved.store(value, subclass)
+        return subclass
+
+
+    def coerce(self, value: Any) -> Any:
+        """
+        Selector values arrive as strings far more often than not, but the
+        discriminator field holds a Version.
+        """
+
+        return _ensure_version(value)
 
 
 class VersionedSelector(MatchSelector):
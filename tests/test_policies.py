@@ -89,6 +89,7 @@ def test_resolve_version_ge(
         ("2.0.0", Version.parse("2.0.0"), "exact match"),
         ("1.1.5", None, "selector between versions"),
         (">=1.0.0;<2.0.0", Version.parse("1.2.0"), "range selector"),
+        (">=1.0.0; <2.0.0; !=1.2.0", Version.parse("1.1.0"), "range selector with exclusion"),
         (">=3.0.0;<4.0.0", None, "range selector without candidates"),
     ],
 )
@@ -12,6 +12,20 @@ import pytest
 from semver import Version
 
 from preoccupied.pydantic.selector import SemverMap
+from preoccupied.pydantic.selector.semvermap import LRUCache, ResolveVersionGE
+
+
+class ResolveVersionLT:
+    """
+    Custom policy resolving to the greatest version strictly below the
+    selector, so that it never resolves a stored version to itself.
+    """
+
+    def resolve(self, selector, available):
+        if isinstance(selector, str):
+            selector = Version.parse(selector)
+        below = [v for v in available if v < selector]
+        return below[-1] if below else None
 
 
 @pytest.fixture
@@ -63,6 +77,84 @@ def test_get_with_policy_override(sample_map):
     assert result == "alpha"
 
 
+def test_get_version_accepts_parsed_versions():
+    """
+    get_version resolves Version instances through the default policy.
+    """
+
+    mapping = SemverMap(default_policy="le")
+    mapping.set("1.0.0", "alpha")
+    mapping.set("1.2.0", "bravo")
+
+    assert mapping.get_version(Version.parse("1.2.0")) == "bravo"
+    assert mapping.get_version(Version.parse("1.1.0")) == "alpha"
+    assert mapping.get_version(Version.parse("0.1.0"), None) is None
+
+    with pytest.raises(ValueError):
+        mapping.get_version(Version.parse("0.1.0"))
+
+
+def test_get_many(sample_map):
+    """
+    get_many resolves a batch of selectors in order.
+    """
+
+    selectors = ["2.0.0", "1.0.0", ">=1.1.0;<2.0.0", "9.9.9"]
+    assert sample_map.get_many(selectors, default=None) == [
+        "charlie", "alpha", "bravo", None]
+
+    assert sample_map.get_many(["1.1.5", "2.5.0"], policy="le") == [
+        "alpha", "charlie"]
+
+    with pytest.raises(ValueError):
+        sample_map.get_many(["1.0.0", "9.9.9"])
+
+
+def test_get_with_invalid_policy_raises(sample_map):
+    """
+    Unknown policy names are rejected by name.
+    """
+
+    with pytest.raises(ValueError, match="Invalid policy: sideways"):
+        sample_map.get("1.0.0", policy="sideways")
+
+
+def test_default_policy_instance():
+    """
+    A ResolutionPolicy instance is honoured as the default policy.
+    """
+
+    mapping = SemverMap(default_policy=ResolveVersionGE())
+    mapping.set("1.0.0", "alpha")
+    mapping.set("2.0.0", "bravo")
+
+    assert mapping.get("1.5.0") == "bravo"
+
+
+def test_custom_policy_skips_exact_match(sample_map):
+    """
+    An explicit custom policy is consulted even when the selector names a
+    stored version.
+    """
+
+    assert sample_map.get("2.0.0", policy=ResolveVersionLT()) == "bravo"
+    assert sample_map.get("2.0.0", policy="le") == "charlie"
+
+
+def test_custom_default_policy_skips_exact_match():
+    """
+    A custom default policy is consulted even when the selector names a
+    stored version.
+    """
+
+    mapping = SemverMap(default_policy=ResolveVersionLT())
+    mapping.set("1.0.0", "alpha")
+    mapping.set("2.0.0", "bravo")
+
+    assert mapping.get("2.0.0") == "alpha"
+    assert mapping.get_version(Version.parse("2.0.0")) == "alpha"
+
+
 def test_dunder_getitem(sample_map):
     """
     __getitem__ delegates to get for convenience access.
@@ -102,6 +194,119 @@ def test_earliest_and_latest(sample_map):
     assert sample_map.latest() == Version.parse("2.0.0")
 
 
+def test_unordered_set_and_delete_keep_order():
+    """
+    Versions set out of order, then deleted, still resolve in semantic order.
+    """
+
+    mapping = SemverMap(default_policy="le")
+    mapping.set("2.0.0", "charlie")
+    mapping.set("1.0.0", "alpha")
+    mapping.set("1.2.0", "bravo")
+
+    assert mapping.earliest() == Version.parse("1.0.0")
+    assert mapping.latest() == Version.parse("2.0.0")
+    assert mapping.get("1.5.0") == "bravo"
+
+    assert list(mapping.values()) == ["alpha", "bravo", "charlie"]
+
+    mapping.delete("1.2.0")
+    assert mapping.get("1.5.0") == "alpha"
+    assert list(mapping.items()) == [
+        (Version.parse("1.0.0"), "alpha"),
+        (Version.parse("2.0.0"), "charlie"),
+    ]
+
+    with pytest.raises(KeyError):
+        mapping.delete("1.2.0")
+
+    mapping.delete("2.0.0")
+    assert mapping.latest() == Version.parse("1.0.0")
+
+
+def test_selector_cache_is_bounded():
+    """
+    The selector cache evicts the least recently used selectors and never
+    remembers failed resolutions.
+    """
+
+    mapping = SemverMap(default_policy="le", cache_size=2)
+    mapping.set("1.0.0", "alpha")
+    mapping.set("2.0.0", "bravo")
+
+    assert mapping.get("1.1.0") == "alpha"
+    assert mapping.get("1.2.0") == "alpha"
+    assert mapping.get("2.1.0") == "bravo"
+    assert list(mapping._cache) == ["1.2.0", "2.1.0"]
+
+    assert mapping.get("0.1.0", default=None) is None
+    assert mapping.get(None) == "alpha"
+    assert list(mapping._cache) == ["1.2.0", "2.1.0"]
+
+
+def test_selector_cache_separates_policies():
+    """
+    Explicit policies are cached apart from the default policy, and a
+    new version invalidates every cached resolution.
+    """
+
+    mapping = SemverMap(default_policy="le")
+    mapping.set("1.0.0", "alpha")
+    mapping.set("2.0.0", "bravo")
+
+    assert mapping.get("1.5.0") == "alpha"
+    assert mapping.get("1.5.0", policy="ge") == "bravo"
+    assert mapping.get("1.5.0", policy="le") == "alpha"
+    assert mapping.get("1.5.0") == "alpha"
+
+    mapping.set("1.5.0", "charlie")
+    assert mapping.get("1.5.0", policy="ge") == "charlie"
+    assert mapping.get("1.2.0", policy="ge") == "charlie"
+    assert mapping.get("1.2.0") == "alpha"
+
+
+def test_selector_cache_skips_custom_policies():
+    """
+    Resolutions by custom policies, explicit or default, are never cached.
+    """
+
+    mapping = SemverMap(default_policy="le")
+    mapping.set("1.0.0", "alpha")
+    mapping.set("2.0.0", "bravo")
+
+    for _ in range(3):
+        assert mapping.get("1.5.0", policy=ResolveVersionLT()) == "alpha"
+    assert not mapping._cache
+
+    mapping = SemverMap(default_policy=ResolveVersionLT())
+    mapping.set("1.0.0", "alpha")
+    assert mapping.get("1.5.0") == "alpha"
+    assert not mapping._cache
+
+
+def test_lru_cache_tolerates_concurrent_eviction():
+    """
+    An entry dropped by another thread partway through a lookup is still
+    returned, rather than raising KeyError.
+    """
+
+    class RacingCache(LRUCache):
+        def get(self, key, default=None):
+            found = super().get(key, default)
+            self.clear()
+            return found
+
+    cache = RacingCache(2)
+    cache.store("1.0.0", 0)
+    assert cache.lookup("1.0.0") == 0
+    assert cache.lookup("1.0.0") is None
+
+    cache.store("1.0.0", 0)
+    cache.store("1.1.0", 1)
+    cache.store("1.2.0", 2)
+    assert list(cache) == ["1.1.0", "1.2.0"]
+
+
 @pytest.mark.parametrize(
     "policy, selector, expectation",
     [
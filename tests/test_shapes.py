@@ -8,18 +8,30 @@ Demonstrate discriminator-driven model dispatch using Shape façade.
 """
 
 
-from types import SimpleNamespace
+import re
+from datetime import datetime
+from types import MappingProxyType, SimpleNamespace
 
 import pytest
-from pydantic import Field
+from pydantic import ConfigDict, Field, ValidationError, model_validator
 
 from preoccupied.pydantic.selector import (
     Discriminator, MatchSelector, Match)
+from preoccupied.pydantic.selector.discriminator import DiscriminatorConfig
 
 
-def test_shape_subclass_requires_single_match():
+_EXACTLY_ONE_MATCH = re.compile("must declare exactly one Match field")
+_EXACTLY_ONE_DISCRIMINATOR = re.compile("must declare exactly one Discriminator field")
+_DUPLICATE_SELECTOR = re.compile("Duplicate selector value")
+_REQUIRES_DISCRIMINATOR = re.compile("requires discriminator field")
+_NO_DISCRIMINATOR_MATCH = re.compile("No discriminator match")
+
+
+@pytest.fixture(scope="module")
+def bare_shape():
     """
-    Subclasses must provide exactly one match selector override.
+    Provide a façade declaring only a discriminator. Tests may only use it
+    for subclass definitions that fail to register.
     """
 
     class Shape(MatchSelector):
@@ -29,8 +41,16 @@ def test_shape_subclass_requires_single_match():
 
         name: str = Discriminator()
 
-    with pytest.raises(ValueError) as error:
-        class NoMatchShape(Shape):
+    return Shape
+
+
+def test_shape_subclass_requires_single_match(bare_shape):
+    """
+    Subclasses must provide exactly one match selector override.
+    """
+
+    with pytest.raises(ValueError, match=_EXACTLY_ONE_MATCH):
+        class NoMatchShape(bare_shape):
             """
             Subclass failing to provide match configuration.
             """
@@ -39,14 +59,29 @@ def test_shape_subclass_requires_single_match():
 
         NoMatchShape  # pragma: no cover
 
-    assert "must declare exactly one Match field" in str(error.value)
 
-
-def test_shape_subclass_rejects_multiple_matches():
+def test_shape_subclass_rejects_multiple_matches(bare_shape):
     """
     Subclasses cannot declare more than one match selector.
     """
 
+    with pytest.raises(ValueError, match=_EXACTLY_ONE_MATCH):
+        class MultiMatchShape(bare_shape):
+            """
+            Subclass declaring multiple match configurations.
+            """
+
+            name: str = Match("polygon")
+            alias: str = Match("poly")
+
+        MultiMatchShape  # pragma: no cover
+
+
+def test_shape_selector_keyword_declares_match():
+    """
+    The selector class keyword declares the discriminator via Match.
+    """
+
     class Shape(MatchSelector):
         """
         Façade declaring a discriminator for testing.
@@ -54,18 +89,37 @@ def test_shape_subclass_rejects_multiple_matches():
 
         name: str = Discriminator()
 
-    with pytest.raises(ValueError) as error:
-        class MultiMatchShape(Shape):
+    class Hexagon(Shape, selector="hexagon"):
+        """
+        Subclass registered through the class keyword.
+        """
+
+        side: float
+
+    assert Hexagon.model_fields["name"].default == "hexagon"
+
+    instance = Shape.model_validate({"name": "hexagon", "side": 1.0})
+    assert type(instance) is Hexagon
+
+    with pytest.raises(TypeError, match="cannot both declare 'name'"):
+        class Octagon(Shape, selector="octagon"):
             """
-            Subclass declaring multiple match configurations.
+            Subclass declaring its selector twice.
             """
 
-            name: str = Match("polygon")
-            alias: str = Match("poly")
+            name: str = Match("octagon")
 
-        MultiMatchShape  # pragma: no cover
+        Octagon  # pragma: no cover
+
+    with pytest.raises(TypeError, match="must subclass a façade"):
+        class Loner(MatchSelector, selector="loner"):
+            """
+            Class using the selector keyword without a façade.
+            """
+
+            pass
 
-    assert "must declare exactly one Match field" in str(error.value)
+        Loner  # pragma: no cover
 
 
 def test_shape_duplicate_match_values_disallowed():
@@ -87,7 +141,7 @@ def test_shape_duplicate_match_values_disallowed():
 
         name: str = Match("duplicate")
 
-    with pytest.raises(ValueError) as error:
+    with pytest.raises(ValueError, match=_DUPLICATE_SELECTOR):
         class DuplicateShape(Shape):
             """
             Subclass reusing existing match value.
@@ -97,15 +151,13 @@ def test_shape_duplicate_match_values_disallowed():
 
         DuplicateShape  # pragma: no cover
 
-    assert "Duplicate selector value" in str(error.value)
-
 
 def test_shape_requires_single_discriminator():
     """
     Facade definitions must declare exactly one discriminator field.
     """
 
-    with pytest.raises(ValueError) as error:
+    with pytest.raises(ValueError, match=_EXACTLY_ONE_DISCRIMINATOR):
         class FacadeWithoutDiscriminator(MatchSelector):
             """
             Facade lacking discriminator; registration should fail.
@@ -115,15 +167,13 @@ def test_shape_requires_single_discriminator():
 
         FacadeWithoutDiscriminator  # pragma: no cover
 
-    assert "must declare exactly one Discriminator field" in str(error.value)
-
 
 def test_shape_rejects_multiple_discriminators():
     """
     Facade definitions cannot declare more than one discriminator field.
     """
 
-    with pytest.raises(ValueError) as error:
+    with pytest.raises(ValueError, match=_EXACTLY_ONE_DISCRIMINATOR):
         class FacadeWithMultipleDiscriminators(MatchSelector):
             """
             Facade declaring two discriminators; registration should fail.
@@ -134,13 +184,25 @@ def test_shape_rejects_multiple_discriminators():
 
         FacadeWithMultipleDiscriminators  # pragma: no cover
 
-    assert "must declare exactly one Discriminator field" in str(error.value)
 
+def test_discriminator_metadata_is_not_shared_with_caller():
+    """
+    Discriminator options are added to a copy of caller-provided metadata.
+    """
+
+    metadata = {"note": "kept"}
+    info = Discriminator(missing_value="blob", metadata=metadata)
+    assert metadata == {"note": "kept"}
 
-@pytest.fixture
-def shapes():
+    config = info.metadata[-1]
+    assert isinstance(config, DiscriminatorConfig)
+    assert config.metadata == {"note": "kept", "missing_value": "blob"}
+
+
+def _build_standard_shapes(**discriminator):
     """
-    Provide a namespace containing Shape façade and concrete subclasses.
+    Define a Shape façade with the given Discriminator options, along with
+    the standard Circle, Triangle, Rectangle, and Square subclasses.
     """
 
     class Shape(MatchSelector):
@@ -148,9 +210,7 @@ def shapes():
         Façade capturing shared shape attributes and discriminator selector.
         """
 
-        name: str = Discriminator(
-            description="Identifier selecting the concrete shape model.",
-        )
+        name: str = Discriminator(**discriminator)
         color: str = Field(default="black")
 
     class Circle(Shape):
@@ -189,12 +249,31 @@ def shapes():
         width: float = Field(init=False, frozen=True, default=None)
         height: float = Field(init=False, frozen=True, default=None)
 
-        def model_post_init(self, __context) -> None:
-            super().model_post_init(__context)
-            object.__setattr__(self, "width", self.side)
-            object.__setattr__(self, "height", self.side)
+        @model_validator(mode="before")
+        @classmethod
+        def _side_to_dimensions(cls, data):
+            if isinstance(data, dict) and "side" in data:
+                data = dict(data, width=data["side"], height=data["side"])
+            return data
+
+    return SimpleNamespace(
+        Shape=Shape,
+        Circle=Circle,
+        Triangle=Triangle,
+        Rectangle=Rectangle,
+        Square=Square,
+    )
 
-    return SimpleNamespace(**locals())
+
+@pytest.fixture(scope="module")
+def shapes():
+    """
+    Provide a namespace containing Shape façade and concrete subclasses.
+    """
+
+    return _build_standard_shapes(
+        description="Identifier selecting the concrete shape model.",
+    )
 
 
 def test_shape_model_validate_returns_concrete_subclass(shapes):
@@ -220,18 +299,200 @@ def test_shape_instantiation_creates_concrete_instance(shapes):
     assert instance.height == 4.0
 
 
+def test_shape_instantiation_argument_forms(shapes):
+    """
+    Façades accept either keywords or a single positional payload.
+    """
+
+    instance = shapes.Shape({"name": "circle", "radius": 1.0})
+    assert isinstance(instance, shapes.Circle)
+
+    with pytest.raises(TypeError, match="Mixing positional and keyword"):
+        shapes.Shape({"name": "circle"}, radius=1.0)
+
+    with pytest.raises(TypeError, match="Unexpected positional arguments"):
+        shapes.Shape({"name": "circle"}, {"radius": 1.0})
+
+
+def test_shape_model_validate_passes_instances_through(shapes):
+    """
+    Validating an existing instance through the façade returns it as-is.
+    """
+
+    circle = shapes.Circle(radius=1.0)
+    assert shapes.Shape.model_validate(circle) is circle
+
+
+def test_shape_model_validate_honours_subclass_revalidation():
+    """
+    Instances of a subclass that always revalidates are revalidated when
+    given to the façade, just as they are by the subclass itself.
+    """
+
+    class Shape(MatchSelector):
+        """
+        Façade declaring a discriminator for testing.
+        """
+
+        name: str = Discriminator()
+
+    class Circle(Shape):
+        """
+        Circle which always revalidates instances.
+        """
+
+        model_config = ConfigDict(revalidate_instances="always")
+
+        name: str = Match("circle")
+        radius: float
+
+    circle = Circle(radius=1.0)
+
+    instance = Shape.model_validate(circle)
+    assert type(instance) is Circle
+    assert instance is not circle
+    assert instance == circle
+
+    assert Circle.model_validate(circle) is not circle
+
+
+def test_shape_subclass_model_validate_skips_dispatch(shapes):
+    """
+    Validating against a concrete subclass does not consult the registry.
+    """
+
+    instance = shapes.Circle.model_validate({"radius": 1.5})
+    assert type(instance) is shapes.Circle
+    assert instance.name == "circle"
+    assert instance.radius == 1.5
+
+
+def test_shape_model_validate_json_uses_json_mode():
+    """
+    The façade dispatches JSON input, which the subclass then validates
+    under JSON-mode rules, even when strict.
+    """
+
+    class Event(MatchSelector):
+        """
+        Façade declaring a discriminator for testing.
+        """
+
+        kind: str = Discriminator()
+
+    class Meeting(Event):
+        """
+        Subclass with a field that strict mode only accepts from JSON.
+        """
+
+        kind: str = Match("meeting")
+        when: datetime
+
+    data = '{"kind": "meeting", "when": "2024-01-01T00:00:00"}'
+    instance = Event.model_validate_json(data, strict=True)
+    assert type(instance) is Meeting
+    assert instance.when == datetime(2024, 1, 1)
+
+
+def test_shape_model_validate_json_reports_invalid_json(shapes):
+    """
+    Malformed JSON given to a façade raises a ValidationError.
+    """
+
+    with pytest.raises(ValidationError) as excinfo:
+        shapes.Shape.model_validate_json('{"name": "circle",')
+    assert excinfo.value.errors()[0]["type"] == "json_invalid"
+
+
+def test_shape_subclass_model_validate_json_forwards_options(shapes):
+    """
+    Concrete subclasses accept the full BaseModel.model_validate_json
+    signature.
+    """
+
+    instance = shapes.Circle.model_validate_json('{"radius": 2.0}', by_alias=True)
+    assert type(instance) is shapes.Circle
+    assert instance.radius == 2.0
+
+
+def test_shape_trusted_facade_constructs_without_validation():
+    """
+    Trusted façades build the dispatched subclass without validating it.
+    """
+
+    class Shape(MatchSelector):
+        """
+        Façade whose payloads are trusted.
+        """
+
+        __selector_trusted__ = True
+
+        name: str = Discriminator()
+
+    class Circle(Shape):
+        """
+        Circle-specific properties.
+        """
+
+        name: str = Match("circle")
+        radius: float
+
+    instance = Shape.model_validate({"name": "circle", "radius": "wide"})
+    assert type(instance) is Circle
+    assert instance.radius == "wide"
+
+
+def test_shape_trusted_facade_still_validates_json():
+    """
+    Trusted façades validate JSON input, so its values are still coerced.
+    """
+
+    class Event(MatchSelector):
+        """
+        Façade whose payloads are trusted.
+        """
+
+        __selector_trusted__ = True
+
+        kind: str = Discriminator()
+
+    class Meeting(Event):
+        """
+        Subclass with a field that JSON can only carry as a string.
+        """
+
+        kind: str = Match("meeting")
+        when: datetime
+
+    instance = Event.model_validate_json('{"kind": "meeting", "when": "2024-01-01T00:00:00"}')
+    assert type(instance) is Meeting
+    assert instance.when == datetime(2024, 1, 1)
+
+
+def test_shape_dispatch_construct_skips_validation(shapes):
+    """
+    model_dispatch_construct selects the subclass but does not validate.
+    """
+
+    instance = shapes.Shape.model_dispatch_construct(
+        {"name": "triangle", "base": "3", "height": 4.0})
+    assert type(instance) is shapes.Triangle
+    assert instance.base == "3"
+    assert instance.color == "black"
+
+    instance = shapes.Circle.model_dispatch_construct({"radius": 2.0})
+    assert type(instance) is shapes.Circle
+    assert instance.name == "circle"
+
+
 def test_shape_missing_selector_raises(shapes):
     """
     Omitted selector fails validation by default.
     """
 
     payload = {"radius": 1.0}
-    try:
+    with pytest.raises(ValueError, match=_REQUIRES_DISCRIMINATOR):
         shapes.Shape.model_validate(payload)
-    except ValueError as error:
-        assert "requires discriminator field" in str(error)
-    else:
-        raise AssertionError("Expected ValueError for missing selector")
 
 
 def test_shape_unknown_selector_raises(shapes):
@@ -240,12 +501,8 @@ def test_shape_unknown_selector_raises(shapes):
     """
 
     payload = {"name": "pentagon", "side": 2.0}
-    try:
+    with pytest.raises(ValueError, match=_NO_DISCRIMINATOR_MATCH):
         shapes.Shape.model_validate(payload)
-    except ValueError as error:
-        assert "No discriminator match" in str(error)
-    else:
-        raise AssertionError("Expected ValueError for unknown selector")
 
 
 def test_shape_rectangle_resolution(shapes):
@@ -274,7 +531,7 @@ def test_shape_square_resolution(shapes):
     assert instance.height == 4.0
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def shapes_with_default_value():
     """
     Provide a namespace with allow-missing discriminator lacking a default.
@@ -296,7 +553,7 @@ def shapes_with_default_value():
         name: str = Match("circle")
         radius: float
 
-    return SimpleNamespace(**locals())
+    return SimpleNamespace(Shape=Shape, Circle=Circle)
 
 
 def test_shape_allow_missing_without_default_returns_facade(shapes_with_default_value):
@@ -310,82 +567,67 @@ def test_shape_allow_missing_without_default_returns_facade(shapes_with_default_
     assert instance.color == "silver"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def shapes_with_missing_value():
     """
     Provide a namespace containing Shape façade with default Blob fallback.
     """
 
-    class Shape(MatchSelector):
-        """
-        Façade that falls back to Blob when selector is missing.
-        """
+    shapes = _build_standard_shapes(missing_value="blob")
 
-        name: str = Discriminator(missing_value="blob")
-        color: str = Field(default="black")
-
-    class Circle(Shape):
+    class Blob(shapes.Shape):
         """
-        Circle-specific properties.
+        Default blob shape used when no selector is provided.
         """
 
-        name: str = Match("circle")
-        radius: float
+        name: str = Match("blob")
+        payload: str = Field(default="blob")
 
-    class Triangle(Shape):
-        """
-        Triangle-specific properties.
-        """
+    shapes.Blob = Blob
+    return shapes
 
-        name: str = Match("triangle")
-        base: float
-        height: float
 
-    class Rectangle(Shape):
-        """
-        Rectangle-specific properties.
-        """
+def test_shape_missing_selector_uses_default_blob(shapes_with_missing_value):
+    """
+    When selector is missing, the façade returns the configured fallback class.
+    """
 
-        name: str = Match("rectangle")
-        width: float
-        height: float
+    payload = {"color": "purple"}
+    instance = shapes_with_missing_value.Shape.model_validate(payload)
+    assert isinstance(instance, shapes_with_missing_value.Blob)
+    assert instance.payload == "blob"
+    assert instance.color == "purple"
 
-    class Square(Rectangle):
-        """
-        Square-specific properties.
-        """
 
-        name: str = Match("square")
-        side: float
-        width: float = Field(init=False, frozen=True, default=None)
-        height: float = Field(init=False, frozen=True, default=None)
+def test_shape_missing_selector_json_uses_default_blob(shapes_with_missing_value):
+    """
+    JSON input without a selector also gets the configured fallback class.
+    """
 
-        def model_post_init(self, __context) -> None:
-            super().model_post_init(__context)
-            object.__setattr__(self, "width", self.side)
-            object.__setattr__(self, "height", self.side)
+    instance = shapes_with_missing_value.Shape.model_validate_json('{"color": "purple"}')
+    assert type(instance) is shapes_with_missing_value.Blob
+    assert instance.color == "purple"
 
-    class Blob(Shape):
-        """
-        Default blob shape used when no selector is provided.
-        """
 
-        name: str = Match("blob")
-        payload: str = Field(default="blob")
+def test_shape_missing_selector_leaves_payload_untouched(shapes_with_missing_value):
+    """
+    Filling in a missing selector does not modify the caller's payload.
+    """
 
-    return SimpleNamespace(**locals())
+    payload = {"color": "purple"}
+    shapes_with_missing_value.Shape.model_validate(payload)
+    assert payload == {"color": "purple"}
 
 
-def test_shape_missing_selector_uses_default_blob(shapes_with_missing_value):
+def test_shape_missing_selector_accepts_read_only_mapping(shapes_with_missing_value):
     """
-    When selector is missing, the façade returns the configured fallback class.
+    Non-dict mappings are converted once and then given the fallback selector.
     """
 
-    payload = {"color": "purple"}
+    payload = MappingProxyType({"color": "teal"})
     instance = shapes_with_missing_value.Shape.model_validate(payload)
     assert isinstance(instance, shapes_with_missing_value.Blob)
-    assert instance.payload == "blob"
-    assert instance.color == "purple"
+    assert instance.color == "teal"
 
 
 def test_shape_explicit_blob_selector(shapes_with_missing_value):
@@ -399,7 +641,7 @@ def test_shape_explicit_blob_selector(shapes_with_missing_value):
     assert instance.payload == "goo"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def shapes_with_mismatch_value():
     """
     Provide a namespace where unknown selectors fall back to Curiosity.
@@ -416,23 +658,21 @@ def shapes_with_mismatch_value():
         )
         payload: str = Field(default="shape")
 
-    class Circle(Shape):
+    class Circle(Shape, selector="circle"):
         """
         Circle-specific properties.
         """
 
-        name: str = Match("circle")
         payload: str = Field(default="circle")
 
-    class Curiosity(Shape):
+    class Curiosity(Shape, selector="curiosity"):
         """
         Fallback subclass used for mismatched selectors.
         """
 
-        name: str = Match("curiosity")
         payload: str = Field(default="curiosity")
 
-    return SimpleNamespace(**locals())
+    return SimpleNamespace(Shape=Shape, Circle=Circle, Curiosity=Curiosity)
 
 
 def test_shape_mismatch_selector_routes_to_curiosity(shapes_with_mismatch_value):
@@ -10,20 +10,25 @@ Tests for the semantic-version aware selector facade.
 from types import SimpleNamespace
 
 import pytest
-from semver import Version
+from pydantic_core import PydanticCustomError
 
 from preoccupied.pydantic.selector import (
     Discriminator, Match, Version,
     VersionedSelector)
 
 
-@pytest.fixture
-def documents() -> SimpleNamespace:
+_V2 = Version.parse("2.0.0")
+
+
+def _build_documents(policy: str = "le") -> SimpleNamespace:
     """
-    Provide a namespace containing versioned document selectors and variants.
+    Define a versioned document selector with 1.0.0 and 2.0.0 variants,
+    resolving versions with the given policy.
     """
 
     class Document(VersionedSelector):
+        __version_policy__ = policy
+
         version: Version = Discriminator(missing_value="1.0.0")
         payload: str
 
@@ -35,79 +40,178 @@ def documents() -> SimpleNamespace:
         version: Version = Match("2.0.0")
         payload: str = "v2"
 
-    return SimpleNamespace(**locals())
+    return SimpleNamespace(
+        Document=Document,
+        DocumentV1=DocumentV1,
+        DocumentV2=DocumentV2,
+    )
+
+
+@pytest.fixture(scope="module")
+def documents() -> SimpleNamespace:
+    """
+    Provide a namespace containing versioned document selectors and variants.
+    Shared by the whole module, so tests must not register new variants.
+    """
+
+    return _build_documents()
+
+
+@pytest.fixture
+def fresh_documents() -> SimpleNamespace:
+    """
+    Provide a private copy of the documents namespace, for tests that
+    register additional variants.
+    """
+
+    return _build_documents()
 
 
 @pytest.mark.parametrize(
-    "input_version, expected_cls, expected_payload",
+    "payload, expected_cls, expected_payload",
     [
-        ("1.0.0", "DocumentV1", "v1"),
-        ("2.0.0", "DocumentV2", "v2"),
-        ("2.1.5", "DocumentV2", "v2"),  # nearest lower version via default policy
+        ({"version": "1.0.0"}, "DocumentV1", "v1"),
+        ({"version": "2.0.0"}, "DocumentV2", "v2"),
+        ({"version": "2.1.5"}, "DocumentV2", "v2"),  # nearest lower version via default policy
     ],
 )
 def test_versioned_selector_resolves_nearest_lower(
         documents: SimpleNamespace,
-        input_version: str,
+        payload: dict,
         expected_cls: str,
         expected_payload: str) -> None:
-    instance = documents.Document.model_validate({"version": input_version})
+    instance = documents.Document.model_validate(payload)
     expected_type = getattr(documents, expected_cls)
-    assert isinstance(instance, expected_type)
+    assert type(instance) is expected_type
     assert instance.payload == expected_payload
 
 
 def test_versioned_selector_uses_default_when_missing(documents: SimpleNamespace) -> None:
     instance = documents.Document.model_validate({})
-    assert isinstance(instance, documents.DocumentV1)
+    assert type(instance) is documents.DocumentV1
     assert instance.payload == "v1"
 
 
 def test_versioned_selector_accepts_version_instance(documents: SimpleNamespace) -> None:
-    version_obj = Version.parse("2.0.0")
-    instance = documents.Document.model_validate({"version": version_obj})
-    assert isinstance(instance, documents.DocumentV2)
+    instance = documents.Document.model_validate({"version": _V2})
+    assert type(instance) is documents.DocumentV2
+
+
+@pytest.mark.parametrize(
+    "json_data, expected_cls",
+    [
+        ('{"version": "2.0.0"}', "DocumentV2"),
+        (b'{"version": "1.4.0"}', "DocumentV1"),
+        ("{}", "DocumentV1"),
+    ],
+)
+def test_versioned_selector_json_input(
+        documents: SimpleNamespace,
+        json_data: str,
+        expected_cls: str) -> None:
+    instance = documents.Document.model_validate_json(json_data)
+    assert type(instance) is getattr(documents, expected_cls)
+
+    # concrete variants validate JSON directly
+    instance = documents.DocumentV2.model_validate_json(json_data)
+    assert type(instance) is documents.DocumentV2
 
 
 def test_versioned_selector_raises_for_unmatched_selector(documents: SimpleNamespace) -> None:
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError) as excinfo:
         documents.Document.model_validate({"version": "0.5.0"})
 
+    assert isinstance(excinfo.value, PydanticCustomError)
+    assert excinfo.value.type == "no_discriminator_match"
+    assert excinfo.value.context == {"value": "0.5.0", "facade": "Document"}
 
-@pytest.fixture
-def exact_documents() -> SimpleNamespace:
-    """
-    Provide a namespace containing versioned document selectors and variants.
-    """
 
+def test_versioned_selector_resolution_sees_new_variants(
+        fresh_documents: SimpleNamespace) -> None:
+
+    documents = fresh_documents
+    instance = documents.Document.model_validate({"version": "1.5.0"})
+    assert type(instance) is documents.DocumentV1
+
+    class DocumentV1_5(documents.Document):
+        version: Version = Match("1.5.0")
+        payload: str = "v1.5"
+
+    instance = documents.Document.model_validate({"version": "1.5.0"})
+    assert type(instance) is DocumentV1_5
+
+
+def test_versioned_selector_serializes_version(documents: SimpleNamespace) -> None:
+    instance = documents.Document.model_validate({"version": "2.0.0-rc.1+b7"})
+    assert str(instance.version) == "2.0.0-rc.1+b7"
+    assert instance.model_dump(mode="json")["version"] == "2.0.0-rc.1+b7"
+
+
+def test_versioned_selector_trusted_stores_parsed_version() -> None:
     class Document(VersionedSelector):
-        __version_policy__ = "exact"
+        __selector_trusted__ = True
 
         version: Version = Discriminator(missing_value="1.0.0")
-        payload: str
 
     class DocumentV1(Document):
         version: Version = Match("1.0.0")
-        payload: str = "v1"
 
-    class DocumentV2(Document):
-        version: Version = Match("2.0.0")
-        payload: str = "v2"
+    instance = Document.model_validate({"version": "1.2.0"})
+    assert type(instance) is DocumentV1
+    assert isinstance(instance.version, Version)
+    assert instance.version == Version.parse("1.2.0")
 
-    return SimpleNamespace(**locals())
+    instance = Document.model_validate({})
+    assert type(instance) is DocumentV1
+    assert isinstance(instance.version, Version)
+    assert instance.version == Version.parse("1.0.0")
 
 
-def test_versioned_selector_exact_policy_requires_exact_match(
-        exact_documents: SimpleNamespace) -> None:
+def test_versioned_selector_dispatch_construct_parses_version(
+        documents: SimpleNamespace) -> None:
 
-    instance = exact_documents.Document.model_validate({"version": "2.0.0"})
-    assert isinstance(instance, exact_documents.DocumentV2)
+    dumped = documents.Document.model_validate({"version": "2.1.0"}).model_dump(mode="json")
+    instance = documents.Document.model_dispatch_construct(dumped)
+    assert type(instance) is documents.DocumentV2
+    assert isinstance(instance.version, Version)
+    assert instance.model_dump(mode="json") == dumped
 
-    with pytest.raises(ValueError):
-        exact_documents.Document.model_validate({"version": "2.1.0"})
+    instance = documents.Document.model_dispatch_construct({})
+    assert type(instance) is documents.DocumentV1
+    assert isinstance(instance.version, Version)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def exact_documents() -> SimpleNamespace:
+    """
+    Provide the documents namespace resolved with the exact policy.
+    """
+
+    return _build_documents("exact")
+
+
+@pytest.mark.parametrize(
+    "input_version, expects_error",
+    [
+        ("2.0.0", False),
+        ("2.1.0", True),
+    ],
+)
+def test_versioned_selector_exact_policy_requires_exact_match(
+        exact_documents: SimpleNamespace,
+        input_version: str,
+        expects_error: bool) -> None:
+
+    payload = {"version": input_version}
+    if expects_error:
+        with pytest.raises(ValueError):
+            exact_documents.Document.model_validate(payload)
+    else:
+        instance = exact_documents.Document.model_validate(payload)
+        assert type(instance) is exact_documents.DocumentV2
+
+
+@pytest.fixture(scope="module")
 def le_documents() -> SimpleNamespace:
     """
     Provide a namespace containing versioned document selectors and variants.
@@ -124,7 +228,11 @@ def le_documents() -> SimpleNamespace:
         version: Version = Match("2.0.0")
         payload: str = "v2"
 
-    return SimpleNamespace(**locals())
+    return SimpleNamespace(
+        Document=Document,
+        DocumentV1=DocumentV1,
+        DocumentV2=DocumentV2,
+    )
 
 
 